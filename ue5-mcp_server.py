@@ -6,15 +6,39 @@ import logging
 import json
 import asyncio
 from contextlib import asynccontextmanager
-from typing import AsyncIterator, Dict, Any, List, Optional, Tuple
+from typing import AsyncIterator, Dict, Any, List, Optional, Set, Tuple
 import traceback
 import os
-import requests
+import random
+import httpx
+import numpy as np
 import time
 import sys
 
 from mcp.server.fastmcp import FastMCP, Context
 
+# orjson is much faster than the standard json module but optional
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ijson lets the actor list be parsed incrementally from the response stream, also optional
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# numba compiles the snowman layout math to machine code, also optional
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that leaves the function as plain Python"""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, 
                     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -23,7 +47,22 @@ logger = logging.getLogger("Unreal-MCP-Server")
 # Default Unreal Engine Remote Control API settings
 UE_HOST = "http://127.0.0.1"  # localhost
 UE_PORT = "30010"             # default port
-UE_URL = f"{UE_HOST}:{UE_PORT}/remote/object/call"
+UE_BASE_URL = f"{UE_HOST}:{UE_PORT}"
+UE_CALL_PATH = "/remote/object/call"
+UE_PROPERTY_PATH = "/remote/object/property"
+UE_BATCH_PATH = "/remote/batch"
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Unreal Engine objects called through the Remote Control API
+EDITOR_ACTOR_SUBSYSTEM = "/Script/UnrealEd.Default__EditorActorSubsystem"
+EDITOR_LEVEL_LIBRARY = "/Script/EditorScriptingUtilities.Default__EditorLevelLibrary"
+PYTHON_SCRIPT_LIBRARY = "/Script/PythonScriptPlugin.Default__PythonScriptLibrary"
+
+# Payloads without per-call fields, shared by every request (never mutated)
+GET_ALL_ACTORS_PAYLOAD = {
+    "objectPath": EDITOR_ACTOR_SUBSYSTEM,
+    "functionName": "GetAllLevelActors"
+}
 
 # Default units and dimensions
 # 1 Unreal Unit = 1 centimeter (UE default is actually 1 UU = 1 cm, but now explicitly documented)
@@ -32,34 +71,130 @@ SNOWMAN_WIDTH = 350  # 3.5 meters
 SNOWMAN_LENGTH = 350  # 3.5 meters
 SNOWMAN_HEIGHT_DEFAULT = 400  # 4.0 meters (approximate default height)
 
+# Snowman family layout: offsets from the base position in centimeters, before the spread factor.
+# Spacing is 1.5 times the snowman footprint so neighbouring snowmen don't overlap.
+SNOWMAN_FAMILY_OFFSETS = np.array([
+    [0.0, 0.0, 0.0],      # First snowman at base position
+    [-1.0, 0.6, 0.0],     # Second snowman
+    [1.2, -0.4, 0.0]      # Third snowman
+]) * np.array([SNOWMAN_WIDTH * 1.5, SNOWMAN_LENGTH * 1.5, 0.0])
+
+# Actor transform properties editable through modify_actor:
+# name -> (getter, setter, setter parameter, struct fields, default component value, root component property)
+ACTOR_TRANSFORM_PROPERTIES = {
+    "location": ("GetActorLocation", "SetActorLocation", "NewLocation", ("X", "Y", "Z"), 0, "RelativeLocation"),
+    "rotation": ("GetActorRotation", "SetActorRotation", "NewRotation", ("Pitch", "Yaw", "Roll"), 0, "RelativeRotation"),
+    "scale": ("GetActorScale3D", "SetActorScale3D", "NewScale3D", ("X", "Y", "Z"), 1, "RelativeScale3D")
+}
+
+# JSON helpers, using orjson when it is installed
+def encode_json(obj: Any) -> bytes:
+    """Serializes a Remote Control request body"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+def decode_json(data: bytes) -> Any:
+    """Parses a Remote Control response body"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def format_result(obj: Any) -> str:
+    """Serializes a tool result as indented JSON"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+@njit(cache=True)
+def snowman_positions(base_x: float, base_y: float, base_z: float, offset_factor: float, offsets: np.ndarray) -> np.ndarray:
+    """Returns an (n, 3) array of snowman positions in centimeters from layout offsets around a base position"""
+    return offsets * offset_factor + np.array([base_x, base_y, base_z])
+
+# Random number generator for snowman placement jitter
+RNG = random.Random()
+
+# FTransform skeleton for Duplicate calls with an identity rotation. Shallow-copied per call, only
+# Translation and Scale3D are replaced, so the nested Rotation dict must never be mutated.
+TRANSFORM_TEMPLATE = {
+    "__type": "Transform",
+    "Rotation": {
+        "__type": "Quat",
+        "X": 0.0,
+        "Y": 0.0,
+        "Z": 0.0,
+        "W": 1.0
+    }
+}
+
+# FTransform formats for Duplicate's NewTransform parameter, in the order they are tried.
+# Remote Control versions differ in which one they accept; the first that produces an actor
+# is remembered in transform_shape and used on its own from then on.
+TRANSFORM_SHAPES = ("typed", "struct", "array")
+transform_shape: Optional[str] = None
+
+# Python script run inside Unreal Engine to spawn, scale and label an actor in a single call.
+# The new actor's path is printed after SPAWNED_ACTOR_MARKER so it can be found in the log output.
+SPAWNED_ACTOR_MARKER = "MCP_SPAWNED_ACTOR:"
+SPAWN_ACTOR_SCRIPT = """import unreal
+actor = unreal.EditorLevelLibrary.spawn_actor_from_class(
+    unreal.load_class(None, {blueprint_path!r}),
+    unreal.Vector({x!r}, {y!r}, {z!r}),
+    unreal.Rotator(roll={roll!r}, pitch={pitch!r}, yaw={yaw!r})
+)
+actor.set_actor_scale3d(unreal.Vector({scale_x!r}, {scale_y!r}, {scale_z!r}))
+if {name!r}:
+    actor.set_actor_label({name!r})
+print({marker!r} + actor.get_path_name())
+"""
+
+# Whether the PythonScriptPlugin is available for SPAWN_ACTOR_SCRIPT. Cleared the first time
+# Unreal Engine rejects the call, after which actors are spawned with individual Remote Control calls.
+python_spawn_supported = True
+
+# Whether the Remote Control API accepts partial struct writes to root component properties.
+# Cleared the first time Unreal Engine rejects one, after which modify_actor reads the current
+# transform and writes it back in full instead.
+partial_transform_writes_supported = True
+
 @asynccontextmanager
 async def server_lifespan(server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
     """Manage server startup and shutdown lifecycle"""
     
+    # Shared async HTTP client so Remote Control calls reuse keep-alive connections
+    # and never block the event loop while waiting on Unreal Engine
+    client = httpx.AsyncClient(
+        base_url=UE_BASE_URL,
+        limits=httpx.Limits(max_keepalive_connections=16),
+        timeout=5.0
+    )
+    
     try:
         logger.info("Unreal Engine MCP server starting up...")
         logger.info("Default unit system: CENTIMETERS (1 Unreal Unit = 1 cm)")
         logger.info(f"Snowman standard dimensions: {SNOWMAN_WIDTH}cm x {SNOWMAN_LENGTH}cm")
         
+        # Compile the snowman layout math now, in a worker thread, so the first
+        # spawn_snowman_family call doesn't block the event loop on numba
+        try:
+            await asyncio.to_thread(snowman_positions, 0.0, 0.0, 0.0, 1.0, SNOWMAN_FAMILY_OFFSETS)
+        except Exception as e:
+            logger.warning(f"Could not precompile the snowman layout: {e}")
+        
         # Test Unreal Engine Remote Control API connection on startup
         try:
             # Get list of actors to test connection
-            payload = {
-                "objectPath": "/Script/UnrealEd.Default__EditorActorSubsystem",
-                "functionName": "GetAllLevelActors"
-            }
-            
-            response = requests.put(UE_URL, json=payload, timeout=5)
-            response.raise_for_status()
+            await remote_put(client, UE_CALL_PATH, GET_ALL_ACTORS_PAYLOAD)
             logger.info("Connected to Unreal Engine Remote Control API")
         except Exception as e:
             logger.warning(f"Could not connect to Unreal Engine Remote Control API: {e}")
             logger.warning("Make sure Unreal Engine is running with Remote Control API enabled")
             
-        # Return an empty context
-        yield {}
+        # Expose the HTTP client to the tools
+        yield {"client": client}
     finally:
-        # Shutdown logging
+        # Release pooled connections and log shutdown
+        await client.aclose()
         logger.info("Unreal Engine MCP server shut down")
 
 # Create the MCP server with lifespan support
@@ -70,23 +205,180 @@ mcp = FastMCP(
 )
 
 # Helper functions for the Unreal Engine integration
-async def get_all_level_actors() -> List[str]:
-    """Returns list of all level actors"""
-    payload = {
-        "objectPath": "/Script/UnrealEd.Default__EditorActorSubsystem",
-        "functionName": "GetAllLevelActors"
-    }
+async def remote_put(client: httpx.AsyncClient, path: str, payload: Dict[str, Any]) -> Any:
+    """
+    Sends a JSON payload to a Remote Control API endpoint
     
+    Parameters:
+        client: HTTP client connected to the Remote Control API
+        path: Endpoint path, e.g. UE_CALL_PATH or UE_BATCH_PATH
+        payload: Request body, serialized as JSON
+        
+    Returns:
+        The decoded JSON response body (empty dict if the body is empty)
+    """
+    response = await client.put(path, content=encode_json(payload), headers=JSON_HEADERS)
+    response.raise_for_status()
+    return decode_json(response.content) if response.content else {}
+
+async def get_all_level_actors(client: httpx.AsyncClient) -> List[str]:
+    """Returns list of all level actors"""
     try:
-        response = requests.put(UE_URL, json=payload, timeout=5)
-        response.raise_for_status()
-        result = response.json()
+        result = await remote_put(client, UE_CALL_PATH, GET_ALL_ACTORS_PAYLOAD)
         return result.get("ReturnValue", [])
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error(f"Error getting level actors: {e}")
         return []
 
+async def get_all_level_actors_as_set(client: httpx.AsyncClient) -> frozenset:
+    """
+    Returns the set of all level actors, for callers that only need membership checks
+    
+    With ijson installed the actor paths are parsed straight from the response stream into the set,
+    so the full response and an intermediate list are never held in memory.
+    """
+    if ijson is None:
+        return frozenset(await get_all_level_actors(client))
+    
+    try:
+        actors = set()
+        parsed = ijson.sendable_list()
+        parser = ijson.items_coro(parsed, "ReturnValue.item")
+        
+        async with client.stream("PUT", UE_CALL_PATH, content=encode_json(GET_ALL_ACTORS_PAYLOAD), headers=JSON_HEADERS) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes():
+                parser.send(chunk)
+                actors.update(parsed)
+                del parsed[:]
+        
+        parser.close()
+        actors.update(parsed)
+        return frozenset(actors)
+    except (httpx.HTTPError, ijson.JSONError) as e:
+        logger.error(f"Error getting level actors: {e}")
+        return frozenset()
+
+async def call_batch(
+    client: httpx.AsyncClient,
+    calls: List[Tuple[str, Dict[str, Any]]]
+) -> List[Dict[str, Any]]:
+    """
+    Sends several calls to Unreal Engine in a single Remote Control batch request
+    
+    Parameters:
+        client: HTTP client connected to the Remote Control API
+        calls: list of (endpoint path, payload) pairs to execute in order,
+            e.g. (UE_CALL_PATH, {...}) or (UE_PROPERTY_PATH, {...})
+        
+    Returns:
+        list: One response per call, each with "ResponseCode" and "ResponseBody".
+        If the batch request itself fails, every call is reported as failed.
+    """
+    batch_payload = {
+        "Requests": [
+            {"RequestId": request_id, "URL": path, "Verb": "PUT", "Body": payload}
+            for request_id, (path, payload) in enumerate(calls)
+        ]
+    }
+    
+    try:
+        result = await remote_put(client, UE_BATCH_PATH, batch_payload)
+    except (httpx.HTTPError, json.JSONDecodeError) as e:
+        logger.error(f"Error sending batch request: {e}")
+        return [{"ResponseCode": None, "ResponseBody": str(e)} for _ in calls]
+    
+    # Match responses back to their calls by request id
+    responses = {r.get("RequestId"): r for r in result.get("Responses", [])}
+    return [responses.get(request_id, {}) for request_id in range(len(calls))]
+
+def batch_error(batch_response: Dict[str, Any]) -> Optional[str]:
+    """Returns an error message if a batched call failed, None if it succeeded"""
+    status = batch_response.get("ResponseCode")
+    if status is not None and 200 <= status < 300:
+        return None
+    return f"Remote Control call failed with status {status}: {batch_response.get('ResponseBody')}"
+
+def record_transform_result(
+    results: Dict[str, Any],
+    actor_path: str,
+    prop: str,
+    values: Dict[str, float]
+) -> None:
+    """
+    Adds an applied transform property ("location", "rotation" or "scale") to modify_actor's results
+    
+    values must hold every component of the property (X/Y/Z or Pitch/Yaw/Roll), not just the provided ones.
+    """
+    key = "location_cm" if prop == "location" else prop
+    results[key] = {field.lower(): value for field, value in values.items()}
+    
+    # If this is a snowman, also include the actual dimensions
+    if prop == "scale" and "Snowman_BP" in actor_path:
+        results[key]["actual_dimensions_cm"] = {
+            "width": SNOWMAN_WIDTH * values["X"],
+            "length": SNOWMAN_LENGTH * values["Y"]
+        }
+
+def transform_values(batch_response: Dict[str, Any], prop: str) -> Dict[str, float]:
+    """Returns every component of a transform property from a batched Get call, defaulting missing ones"""
+    _, _, _, fields, default, _ = ACTOR_TRANSFORM_PROPERTIES[prop]
+    current = (batch_response.get("ResponseBody") or {}).get("ReturnValue", {})
+    return {field: current.get(field, default) for field in fields}
+
+async def spawn_actor_with_python(
+    client: httpx.AsyncClient,
+    blueprint_path: str,
+    location: Tuple[float, float, float],
+    rotation: Tuple[float, float, float],
+    scale: Tuple[float, float, float],
+    name: Optional[str]
+) -> Optional[str]:
+    """
+    Spawns, scales and names a blueprint actor in one round trip by running SPAWN_ACTOR_SCRIPT
+    through the PythonScriptPlugin
+    
+    Raises httpx.HTTPStatusError if Unreal Engine rejects the call, e.g. when the plugin is disabled.
+    
+    Returns:
+        str: Actor path if successful, None if the script failed
+    """
+    script = SPAWN_ACTOR_SCRIPT.format(
+        blueprint_path=blueprint_path,
+        x=float(location[0]), y=float(location[1]), z=float(location[2]),
+        pitch=float(rotation[0]), yaw=float(rotation[1]), roll=float(rotation[2]),
+        scale_x=float(scale[0]), scale_y=float(scale[1]), scale_z=float(scale[2]),
+        name=name,
+        marker=SPAWNED_ACTOR_MARKER
+    )
+    
+    payload = {
+        "objectPath": PYTHON_SCRIPT_LIBRARY,
+        "functionName": "ExecutePythonCommandEx",
+        "parameters": {
+            "PythonCommand": script,
+            "ExecutionMode": "ExecuteFile"
+        },
+        "generateTransaction": True
+    }
+    
+    result = await remote_put(client, UE_CALL_PATH, payload)
+    
+    if not result.get("ReturnValue"):
+        logger.error(f"Spawn script failed: {result.get('CommandResult')}")
+        return None
+    
+    # Find the actor path printed by the script
+    for entry in result.get("LogOutput", []):
+        output = entry.get("Output", "")
+        if output.startswith(SPAWNED_ACTOR_MARKER):
+            return output[len(SPAWNED_ACTOR_MARKER):].strip()
+    
+    logger.error("No actor path returned from spawn script")
+    return None
+
 async def spawn_blueprint_actor(
+    client: httpx.AsyncClient,
     blueprint_path: str, 
     location: Tuple[float, float, float] = (0, 0, 0), 
     rotation: Tuple[float, float, float] = (0, 0, 0), 
@@ -97,6 +389,7 @@ async def spawn_blueprint_actor(
     Spawns a blueprint actor in Unreal Engine using the Remote Control API
     
     Parameters:
+        client: HTTP client connected to the Remote Control API
         blueprint_path: Path to the blueprint asset in the content browser
         location: tuple of (x, y, z) coordinates in centimeters
         rotation: tuple of (pitch, yaw, roll) in degrees
@@ -106,8 +399,10 @@ async def spawn_blueprint_actor(
     Returns:
         str: Actor path if successful, None if failed
     """
+    global python_spawn_supported
+    
     spawn_payload = {
-        "objectPath": "/Script/EditorScriptingUtilities.Default__EditorLevelLibrary",
+        "objectPath": EDITOR_LEVEL_LIBRARY,
         "functionName": "SpawnActorFromClass",
         "parameters": {
             "ActorClass": blueprint_path,
@@ -118,236 +413,274 @@ async def spawn_blueprint_actor(
     }
 
     try:
-        # Spawn the actor
         logger.info(f"Spawning {blueprint_path} at location {location}cm")
-        response = requests.put(UE_URL, json=spawn_payload, timeout=5)
-        response.raise_for_status()
-        result = response.json()
+        
+        # Spawn, scale and name the actor in a single call when Python scripting is available
+        if python_spawn_supported:
+            try:
+                actor_path = await spawn_actor_with_python(client, blueprint_path, location, rotation, scale, name)
+            except httpx.HTTPStatusError as e:
+                logger.warning(f"Python spawn unavailable, using individual Remote Control calls: {e}")
+                python_spawn_supported = False
+            else:
+                if actor_path:
+                    logger.info(f"Successfully spawned actor: {actor_path}")
+                return actor_path
+        
+        # Spawn the actor
+        result = await remote_put(client, UE_CALL_PATH, spawn_payload)
         actor_path = result.get("ReturnValue")
         
         if not actor_path:
             logger.error("No actor path returned from spawn request")
             return None
             
+        follow_up_payloads = []
+        
         # Set scale if needed
         if scale != (1, 1, 1):
-            set_scale_payload = {
+            follow_up_payloads.append({
                 "objectPath": actor_path,
                 "functionName": "SetActorScale3D",
                 "parameters": {
                     "NewScale3D": {"X": scale[0], "Y": scale[1], "Z": scale[2]}
                 }
-            }
-            
-            response = requests.put(UE_URL, json=set_scale_payload, timeout=5)
-            response.raise_for_status()
+            })
             
         # Set name if provided
         if name:
-            set_name_payload = {
+            follow_up_payloads.append({
                 "objectPath": actor_path,
                 "functionName": "SetActorLabel",
                 "parameters": {
                     "NewActorLabel": name
                 }
-            }
+            })
             
-            response = requests.put(UE_URL, json=set_name_payload, timeout=5)
-            response.raise_for_status()
+        # Apply scale and name in a single round trip
+        if follow_up_payloads:
+            for batch_response in await call_batch(client, [(UE_CALL_PATH, payload) for payload in follow_up_payloads]):
+                error = batch_error(batch_response)
+                if error:
+                    logger.error(f"Error configuring spawned actor: {error}")
+                    return None
             
         logger.info(f"Successfully spawned actor: {actor_path}")
         return actor_path
             
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error(f"Error spawning blueprint actor: {e}")
-        if hasattr(e, 'response') and e.response:
+        if isinstance(e, httpx.HTTPStatusError):
             logger.error(f"Response details: {e.response.text}")
         return None
     except Exception as e:
         logger.error(f"Unexpected error: {e}")
         return None
 
+def build_transform(
+    shape: str,
+    location: Tuple[float, float, float],
+    scale: Tuple[float, float, float]
+) -> Dict[str, Any]:
+    """Builds an FTransform with an identity rotation in one of the TRANSFORM_SHAPES formats"""
+    if shape == "typed":
+        # Properly formatted FTransform structure for UE, sharing the constant parts of the template
+        transform = TRANSFORM_TEMPLATE.copy()
+        transform["Scale3D"] = {"__type": "Vector", "X": scale[0], "Y": scale[1], "Z": scale[2]}
+        transform["Translation"] = {"__type": "Vector", "X": location[0], "Y": location[1], "Z": location[2]}
+        return transform
+    
+    if shape == "struct":
+        return {
+            "Translation": {"X": location[0], "Y": location[1], "Z": location[2]},
+            "Rotation": {"X": 0.0, "Y": 0.0, "Z": 0.0, "W": 1.0},
+            "Scale3D": {"X": scale[0], "Y": scale[1], "Z": scale[2]}
+        }
+    
+    return {
+        "Translation": [location[0], location[1], location[2]],
+        "Rotation": [0.0, 0.0, 0.0, 1.0],  # Quaternion X,Y,Z,W
+        "Scale3D": [scale[0], scale[1], scale[2]]
+    }
+
+def claim_new_actor(
+    after_actors: List[str],
+    before_actors: frozenset,
+    claimed_actors: Set[str]
+) -> Optional[str]:
+    """Returns the newest actor not present before duplication and not already claimed, and claims it"""
+    new_actors = [actor for actor in after_actors if actor not in before_actors and actor not in claimed_actors]
+    if not new_actors:
+        return None
+    
+    claimed_actors.add(new_actors[-1])
+    return new_actors[-1]
+
+async def wait_for_new_actor(
+    client: httpx.AsyncClient,
+    before_actors: frozenset,
+    claimed_actors: Set[str],
+    attempts: int = 5,
+    initial_delay: float = 0.02
+) -> Optional[str]:
+    """
+    Polls the level actor list until an actor missing from before_actors appears
+    
+    The delay between polls doubles after every attempt (20ms, 40ms, 80ms, ... by default).
+    
+    Returns:
+        str: Path of the claimed new actor, None if none appeared
+    """
+    delay = initial_delay
+    for _ in range(attempts):
+        await asyncio.sleep(delay)
+        after_actors = await get_all_level_actors(client)
+        new_actor_path = claim_new_actor(after_actors, before_actors, claimed_actors)
+        if new_actor_path:
+            return new_actor_path
+        delay *= 2
+    
+    return None
+
 async def duplicate_snowman(
+    client: httpx.AsyncClient,
     snowman_actor_path: str, 
     location: Tuple[float, float, float], 
     rotation: Tuple[float, float, float], 
     scale: Tuple[float, float, float], 
-    name: Optional[str]
+    name: Optional[str],
+    claimed_actors: Optional[Set[str]] = None,
+    before_actors: Optional[frozenset] = None
 ) -> Optional[str]:
     """
     Calls the Duplicate function in Snowman_BP to create a new snowman
     
     Parameters:
+        client: HTTP client connected to the Remote Control API
         snowman_actor_path: Path of the source snowman actor
         location: tuple of (x, y, z) coordinates in centimeters
         rotation: tuple of (pitch, yaw, roll) in degrees
         scale: tuple of (x, y, z) scale factors
         name: Name for the duplicated snowman
+        claimed_actors: Actor paths already taken by concurrent duplications, shared between
+            calls running at the same time so the actor-list fallback never picks another call's actor
+        before_actors: Level actors from before any of the concurrent duplications started. Calls
+            running at the same time must share one snapshot, otherwise a later snapshot already
+            contains an earlier call's new actor and the calls cannot tell their actors apart.
+            Taken by this call if not provided.
         
     Returns:
         str: Actor path of the duplicated snowman if successful, None if failed
     """
-    # Create a properly formatted FTransform structure for UE
-    transform = {
-        "__type": "Transform",
-        "Rotation": {
-            "__type": "Quat",
-            "X": 0.0,
-            "Y": 0.0,
-            "Z": 0.0,
-            "W": 1.0
-        },
-        "Scale3D": {
-            "__type": "Vector",
-            "X": scale[0],
-            "Y": scale[1],
-            "Z": scale[2]
-        },
-        "Translation": {
-            "__type": "Vector",
-            "X": location[0],
-            "Y": location[1],
-            "Z": location[2]
-        }
-    }
-    
-    # Alternative transform formats if needed
-    transform_alt1 = {
-        "Translation": {"X": location[0], "Y": location[1], "Z": location[2]},
-        "Rotation": {"X": 0.0, "Y": 0.0, "Z": 0.0, "W": 1.0},
-        "Scale3D": {"X": scale[0], "Y": scale[1], "Z": scale[2]}
-    }
-    
-    transform_alt2 = {
-        "Translation": [location[0], location[1], location[2]],
-        "Rotation": [0.0, 0.0, 0.0, 1.0],  # Quaternion X,Y,Z,W
-        "Scale3D": [scale[0], scale[1], scale[2]]
-    }
+    global transform_shape
     
-    # Try with the primary transform format
     duplicate_payload = {
         "objectPath": snowman_actor_path,
         "functionName": "Duplicate",
-        "parameters": {
-            "NewTransform": transform
-        },
+        "parameters": {},
         "generateTransaction": True
     }
     
+    if claimed_actors is None:
+        claimed_actors = set()
+    
     try:
         logger.info(f"Duplicating snowman from {snowman_actor_path} to location {location}cm")
         
-        # Get actors before duplication
-        before_actors = await get_all_level_actors()
-        
-        # Send the duplication request
-        response = requests.put(UE_URL, json=duplicate_payload, timeout=5)
-        response.raise_for_status()
-        result = response.json()
+        # Get actors before duplication as a set for constant-time membership checks
+        if before_actors is None:
+            before_actors = await get_all_level_actors_as_set(client)
         
-        # Wait for the actor to be created
-        await asyncio.sleep(0.5)
+        # Use the transform format that worked before, or try each format until one does
+        shapes = (transform_shape,) if transform_shape else TRANSFORM_SHAPES
         
-        # Check if we got a valid return value
-        new_actor_path = result.get("ReturnValue")
-        
-        # If not, try to find the new actor
-        if not new_actor_path:
-            # Try to find the new actor
-            after_actors = await get_all_level_actors()
-            new_actors = [actor for actor in after_actors if actor not in before_actors]
+        for shape in shapes:
+            # Send the duplication request
+            duplicate_payload["parameters"]["NewTransform"] = build_transform(shape, location, scale)
+            try:
+                result = await remote_put(client, UE_CALL_PATH, duplicate_payload)
+            except httpx.HTTPStatusError as e:
+                # Rejected outright, so no actor was created and the next format can be tried safely
+                logger.info(f"Duplicate rejected the {shape} transform format: {e}")
+                continue
             
-            if new_actors:
-                new_actor_path = new_actors[-1]
-                logger.info(f"Found new actor: {new_actor_path}")
+            # Check if we got a valid return value, otherwise try to find the new actor
+            new_actor_path = result.get("ReturnValue")
+            if isinstance(new_actor_path, str) and new_actor_path:
+                claimed_actors.add(new_actor_path)
             else:
-                # If no new actor was found, try alternate transform formats
-                logger.info("No return value and no new actor found. Trying alternate transform format...")
-                
-                # Try first alternative format
-                duplicate_payload["parameters"]["NewTransform"] = transform_alt1
-                response = requests.put(UE_URL, json=duplicate_payload, timeout=5)
-                response.raise_for_status()
-                
-                await asyncio.sleep(0.5)
-                after_actors = await get_all_level_actors()
-                new_actors = [actor for actor in after_actors if actor not in before_actors]
-                
-                if new_actors:
-                    new_actor_path = new_actors[-1]
-                    logger.info(f"Found new actor with alt format 1: {new_actor_path}")
-                else:
-                    # Try second alternative format
-                    duplicate_payload["parameters"]["NewTransform"] = transform_alt2
-                    response = requests.put(UE_URL, json=duplicate_payload, timeout=5)
-                    response.raise_for_status()
-                    
-                    await asyncio.sleep(0.5)
-                    after_actors = await get_all_level_actors()
-                    new_actors = [actor for actor in after_actors if actor not in before_actors]
-                    
-                    if new_actors:
-                        new_actor_path = new_actors[-1]
-                        logger.info(f"Found new actor with alt format 2: {new_actor_path}")
-                    else:
-                        logger.error("Failed to duplicate actor with all transform formats.")
-                        return None
+                new_actor_path = await wait_for_new_actor(client, before_actors, claimed_actors)
+                if new_actor_path:
+                    logger.info(f"Found new actor: {new_actor_path}")
+            
+            if not new_actor_path:
+                # Accepted, so an actor may still appear later. Retrying with another format could
+                # leave an extra unlabeled copy in the level, so give up instead.
+                logger.error(f"Duplicate accepted the {shape} transform format but no new actor was found")
+                return None
+            
+            if transform_shape != shape:
+                logger.info(f"Remote Control API accepts the {shape} transform format")
+                transform_shape = shape
+            break
+        else:
+            logger.error("Failed to duplicate actor with all transform formats.")
+            return None
         
         # If we have a new actor path, set its properties
         if new_actor_path:
-            # Set the location directly to ensure it's in the right place
-            set_location_payload = {
-                "objectPath": new_actor_path,
-                "functionName": "SetActorLocation",
-                "parameters": {
-                    "NewLocation": {"X": location[0], "Y": location[1], "Z": location[2]}
-                }
-            }
-            response = requests.put(UE_URL, json=set_location_payload, timeout=5)
-            response.raise_for_status()
-            
-            # Set the rotation
-            set_rotation_payload = {
-                "objectPath": new_actor_path,
-                "functionName": "SetActorRotation",
-                "parameters": {
-                    "NewRotation": {"Pitch": rotation[0], "Yaw": rotation[1], "Roll": rotation[2]}
-                }
-            }
-            response = requests.put(UE_URL, json=set_rotation_payload, timeout=5)
-            response.raise_for_status()
-            
-            # Set the scale
-            set_scale_payload = {
-                "objectPath": new_actor_path,
-                "functionName": "SetActorScale3D",
-                "parameters": {
-                    "NewScale3D": {"X": scale[0], "Y": scale[1], "Z": scale[2]}
+            property_payloads = [
+                # Set the location directly to ensure it's in the right place
+                {
+                    "objectPath": new_actor_path,
+                    "functionName": "SetActorLocation",
+                    "parameters": {
+                        "NewLocation": {"X": location[0], "Y": location[1], "Z": location[2]}
+                    }
+                },
+                # Set the rotation
+                {
+                    "objectPath": new_actor_path,
+                    "functionName": "SetActorRotation",
+                    "parameters": {
+                        "NewRotation": {"Pitch": rotation[0], "Yaw": rotation[1], "Roll": rotation[2]}
+                    }
+                },
+                # Set the scale
+                {
+                    "objectPath": new_actor_path,
+                    "functionName": "SetActorScale3D",
+                    "parameters": {
+                        "NewScale3D": {"X": scale[0], "Y": scale[1], "Z": scale[2]}
+                    }
                 }
-            }
-            response = requests.put(UE_URL, json=set_scale_payload, timeout=5)
-            response.raise_for_status()
+            ]
             
             # Set name if provided
             if name:
-                set_name_payload = {
+                property_payloads.append({
                     "objectPath": new_actor_path,
                     "functionName": "SetActorLabel",
                     "parameters": {
                         "NewActorLabel": name
                     }
-                }
-                response = requests.put(UE_URL, json=set_name_payload, timeout=5)
-                response.raise_for_status()
+                })
+            
+            # Apply all properties in a single round trip
+            for batch_response in await call_batch(client, [(UE_CALL_PATH, payload) for payload in property_payloads]):
+                error = batch_error(batch_response)
+                if error:
+                    logger.error(f"Error configuring duplicated snowman: {error}")
+                    return None
             
             logger.info(f"Successfully duplicated snowman: {new_actor_path}")
             return new_actor_path
         
         return None
             
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error(f"Error duplicating snowman: {e}")
-        if hasattr(e, 'response') and e.response:
+        if isinstance(e, httpx.HTTPStatusError):
             logger.error(f"Response details: {e.response.text}")
         return None
     except Exception as e:
@@ -364,8 +697,9 @@ async def get_all_scene_actors(ctx: Context) -> str:
         JSON string containing the list of actor paths
     """
     try:
-        actors = await get_all_level_actors()
-        return json.dumps({"actors": actors, "count": len(actors)}, indent=2)
+        client = ctx.request_context.lifespan_context["client"]
+        actors = await get_all_level_actors(client)
+        return format_result({"actors": actors, "count": len(actors)})
     except Exception as e:
         logger.error(f"Error in get_all_scene_actors: {str(e)}")
         logger.error(traceback.format_exc())
@@ -400,11 +734,13 @@ async def spawn_actor(
         JSON string with the result of the spawn operation
     """
     try:
+        client = ctx.request_context.lifespan_context["client"]
         location = (x, y, z)
         rotation = (pitch, yaw, roll)
         scale = (scale_x, scale_y, scale_z)
         
         actor_path = await spawn_blueprint_actor(
+            client,
             blueprint_path=blueprint_path,
             location=location,
             rotation=rotation,
@@ -413,27 +749,27 @@ async def spawn_actor(
         )
         
         if actor_path:
-            return json.dumps({
+            return format_result({
                 "success": True,
                 "actor_path": actor_path,
                 "location_cm": {"x": x, "y": y, "z": z},
                 "rotation": {"pitch": pitch, "yaw": yaw, "roll": roll},
                 "scale": {"x": scale_x, "y": scale_y, "z": scale_z},
                 "name": name or "Unnamed"
-            }, indent=2)
+            })
         else:
-            return json.dumps({
+            return format_result({
                 "success": False,
                 "error": "Failed to spawn actor"
-            }, indent=2)
+            })
             
     except Exception as e:
         logger.error(f"Error in spawn_actor: {str(e)}")
         logger.error(traceback.format_exc())
-        return json.dumps({
+        return format_result({
             "success": False,
             "error": str(e)
-        }, indent=2)
+        })
 
 @mcp.tool()
 async def spawn_snowman_family(
@@ -460,25 +796,23 @@ async def spawn_snowman_family(
         JSON string with details of the spawned snowmen
     """
     try:
+        client = ctx.request_context.lifespan_context["client"]
+        
         # Path to the Snowman_BP blueprint asset
         snowman_bp_path = "/Game/Snowman_BP.Snowman_BP_C"
         
         # Define positions for the three snowmen (in centimeters)
         if random_placement:
-            import random
-            offset_factor = spread * random.uniform(0.8, 1.2)
+            offset_factor = spread * RNG.uniform(0.8, 1.2)
         else:
             offset_factor = spread
             
-        # Calculate appropriate spacing based on snowman dimensions
-        # Spacing should take into account the width of the snowmen (350cm)
-        spacing_x = SNOWMAN_WIDTH * 1.5  # 1.5 times the width for good spacing
-        spacing_y = SNOWMAN_LENGTH * 1.5
-        
+        # Calculate all three positions at once from the family layout
         positions = [
-            (base_x, base_y, base_z),                                      # First snowman at base position
-            (base_x - spacing_x * offset_factor, base_y + spacing_y * 0.6 * offset_factor, base_z),  # Second snowman
-            (base_x + spacing_x * 1.2 * offset_factor, base_y - spacing_y * 0.4 * offset_factor, base_z)   # Third snowman
+            tuple(position)
+            for position in snowman_positions(
+                float(base_x), float(base_y), float(base_z), float(offset_factor), SNOWMAN_FAMILY_OFFSETS
+            ).tolist()
         ]
         
         # Define scales for the snowmen (varying sizes)
@@ -503,8 +837,8 @@ async def spawn_snowman_family(
         ]
         
         # Spawn the first snowman normally
-        spawned_actors = []
         first_snowman = await spawn_blueprint_actor(
+            client,
             blueprint_path=snowman_bp_path,
             location=positions[0],
             rotation=rotations[0],
@@ -513,64 +847,71 @@ async def spawn_snowman_family(
         )
         
         if not first_snowman:
-            return json.dumps({
+            return format_result({
                 "success": False,
                 "error": "Failed to spawn first snowman, cannot continue",
                 "snowmen": []
-            }, indent=2)
-            
-        spawned_actors.append({
-            "actor_path": first_snowman,
-            "location_cm": {"x": positions[0][0], "y": positions[0][1], "z": positions[0][2]},
-            "size_cm": {"width": SNOWMAN_WIDTH * scales[0][0], "length": SNOWMAN_LENGTH * scales[0][1]},
-            "rotation": {"pitch": rotations[0][0], "yaw": rotations[0][1], "roll": rotations[0][2]},
-            "scale": {"x": scales[0][0], "y": scales[0][1], "z": scales[0][2]},
-            "name": names[0]
-        })
+            })
         
-        # Wait briefly to make actor detection more reliable
-        await asyncio.sleep(0.5)
-        
-        # Now duplicate the first snowman to create the other two
-        for i in range(1, 3):
-            duplicated_snowman = await duplicate_snowman(
-                snowman_actor_path=first_snowman,
-                location=positions[i],
-                rotation=rotations[i],
-                scale=scales[i],
-                name=names[i]
-            )
-            
-            if duplicated_snowman:
-                spawned_actors.append({
-                    "actor_path": duplicated_snowman,
-                    "location_cm": {"x": positions[i][0], "y": positions[i][1], "z": positions[i][2]},
-                    "size_cm": {"width": SNOWMAN_WIDTH * scales[i][0], "length": SNOWMAN_LENGTH * scales[i][1]},
-                    "rotation": {"pitch": rotations[i][0], "yaw": rotations[i][1], "roll": rotations[i][2]},
-                    "scale": {"x": scales[i][0], "y": scales[i][1], "z": scales[i][2]},
-                    "name": names[i]
-                })
-            else:
+        # Now duplicate the first snowman to create the other two, concurrently,
+        # sharing one snapshot of the level taken before either duplication starts
+        before_actors = await get_all_level_actors_as_set(client)
+        claimed_actors = {first_snowman}
+        duplicated_snowmen = await asyncio.gather(
+            *(
+                duplicate_snowman(
+                    client,
+                    snowman_actor_path=first_snowman,
+                    location=positions[i],
+                    rotation=rotations[i],
+                    scale=scales[i],
+                    name=names[i],
+                    claimed_actors=claimed_actors,
+                    before_actors=before_actors
+                )
+                for i in range(1, 3)
+            ),
+            return_exceptions=True
+        )
+        
+        actor_paths = [first_snowman]
+        for i, duplicated_snowman in enumerate(duplicated_snowmen, start=1):
+            if isinstance(duplicated_snowman, BaseException):
+                logger.warning(f"Failed to duplicate snowman {i+1}: {duplicated_snowman}")
+                duplicated_snowman = None
+            elif not duplicated_snowman:
                 logger.warning(f"Failed to duplicate snowman {i+1}")
-            
-            # Wait briefly between duplications to make actor detection more reliable
-            await asyncio.sleep(0.5)
+            actor_paths.append(duplicated_snowman)
+        
+        # Describe every snowman that was created
+        spawned_actors = [
+            {
+                "actor_path": actor_path,
+                "location_cm": {"x": position[0], "y": position[1], "z": position[2]},
+                "size_cm": {"width": SNOWMAN_WIDTH * scale[0], "length": SNOWMAN_LENGTH * scale[1]},
+                "rotation": {"pitch": rotation[0], "yaw": rotation[1], "roll": rotation[2]},
+                "scale": {"x": scale[0], "y": scale[1], "z": scale[2]},
+                "name": name
+            }
+            for actor_path, position, scale, rotation, name in zip(actor_paths, positions, scales, rotations, names)
+            if actor_path
+        ]
         
-        return json.dumps({
+        return format_result({
             "success": True,
             "standard_snowman_dimensions_cm": {"width": SNOWMAN_WIDTH, "length": SNOWMAN_LENGTH},
             "snowmen_count": len(spawned_actors),
             "snowmen": spawned_actors
-        }, indent=2)
+        })
             
     except Exception as e:
         logger.error(f"Error in spawn_snowman_family: {str(e)}")
         logger.error(traceback.format_exc())
-        return json.dumps({
+        return format_result({
             "success": False,
             "error": str(e),
             "snowmen": []
-        }, indent=2)
+        })
 
 @mcp.tool()
 async def modify_actor(
@@ -597,178 +938,179 @@ async def modify_actor(
         scale_x, scale_y, scale_z: New scale factors (if provided)
         name: New name for the actor (if provided)
         
+    Location, rotation and scale components that aren't provided keep their current values. When the
+    Remote Control API accepts partial struct writes, the provided components are written to the root
+    component's relative transform. That equals the world transform set by SetActorLocation and friends
+    unless the actor is attached to a parent, in which case the values are relative to the parent.
+    Either way, the result reports every component of the actor's resulting world transform.
+        
     Returns:
         JSON string with the result of the modification operation
     """
+    global partial_transform_writes_supported
+    
     try:
+        client = ctx.request_context.lifespan_context["client"]
         modified = False
         results = {}
         
-        # Set location if any coordinate is provided
-        if any(param is not None for param in [x, y, z]):
-            # Get current location first for coordinates that weren't specified
-            get_location_payload = {
-                "objectPath": actor_path,
-                "functionName": "GetActorLocation"
-            }
-            
-            try:
-                response = requests.put(UE_URL, json=get_location_payload, timeout=5)
-                response.raise_for_status()
-                current_loc = response.json().get("ReturnValue", {"X": 0, "Y": 0, "Z": 0})
-                
-                # Use current values for any coordinate not specified
-                new_x = x if x is not None else current_loc.get("X", 0)
-                new_y = y if y is not None else current_loc.get("Y", 0)
-                new_z = z if z is not None else current_loc.get("Z", 0)
-                
-                # Set the new location
-                set_location_payload = {
+        # Transform properties with at least one provided component, keeping only those components
+        requested = {}
+        for prop, values in (
+            ("location", (x, y, z)),
+            ("rotation", (pitch, yaw, roll)),
+            ("scale", (scale_x, scale_y, scale_z))
+        ):
+            fields = ACTOR_TRANSFORM_PROPERTIES[prop][3]
+            provided = {field: value for field, value in zip(fields, values) if value is not None}
+            if provided:
+                requested[prop] = provided
+        
+        calls = []
+        call_properties = []
+        readback = []
+        
+        for prop, provided in requested.items():
+            if partial_transform_writes_supported:
+                # Write only the provided components, Unreal Engine keeps the current value of the others,
+                # then read the complete resulting value back within the same batch
+                getter = ACTOR_TRANSFORM_PROPERTIES[prop][0]
+                component_property = ACTOR_TRANSFORM_PROPERTIES[prop][5]
+                calls.append((UE_PROPERTY_PATH, {
                     "objectPath": actor_path,
-                    "functionName": "SetActorLocation",
-                    "parameters": {
-                        "NewLocation": {"X": new_x, "Y": new_y, "Z": new_z}
-                    }
-                }
-                
-                response = requests.put(UE_URL, json=set_location_payload, timeout=5)
-                response.raise_for_status()
-                modified = True
-                results["location_cm"] = {"x": new_x, "y": new_y, "z": new_z}
-                
-            except Exception as e:
-                logger.error(f"Error setting actor location: {e}")
-                results["location_error"] = str(e)
-        
-        # Set rotation if any angle is provided
-        if any(param is not None for param in [pitch, yaw, roll]):
-            # Get current rotation first for angles that weren't specified
-            get_rotation_payload = {
+                    "access": "WRITE_TRANSACTION_ACCESS",
+                    "propertyName": f"RootComponent.{component_property}",
+                    "propertyValue": {component_property: provided}
+                }))
+                calls.append((UE_CALL_PATH, {"objectPath": actor_path, "functionName": getter}))
+                call_properties.append((prop, provided))
+            else:
+                readback.append(prop)
+        
+        # Set name if provided
+        if name is not None:
+            calls.append((UE_CALL_PATH, {
                 "objectPath": actor_path,
-                "functionName": "GetActorRotation"
-            }
-            
-            try:
-                response = requests.put(UE_URL, json=get_rotation_payload, timeout=5)
-                response.raise_for_status()
-                current_rot = response.json().get("ReturnValue", {"Pitch": 0, "Yaw": 0, "Roll": 0})
-                
-                # Use current values for any angle not specified
-                new_pitch = pitch if pitch is not None else current_rot.get("Pitch", 0)
-                new_yaw = yaw if yaw is not None else current_rot.get("Yaw", 0)
-                new_roll = roll if roll is not None else current_rot.get("Roll", 0)
-                
-                # Set the new rotation
-                set_rotation_payload = {
-                    "objectPath": actor_path,
-                    "functionName": "SetActorRotation",
-                    "parameters": {
-                        "NewRotation": {"Pitch": new_pitch, "Yaw": new_yaw, "Roll": new_roll}
-                    }
+                "functionName": "SetActorLabel",
+                "parameters": {
+                    "NewActorLabel": name
                 }
+            }))
+            call_properties.append(("name", name))
+        
+        # Apply every modification in a single batch
+        if calls:
+            responses = iter(await call_batch(client, calls))
+            for prop, value in call_properties:
+                response = next(responses)
+                error = batch_error(response)
                 
-                response = requests.put(UE_URL, json=set_rotation_payload, timeout=5)
-                response.raise_for_status()
-                modified = True
-                results["rotation"] = {"pitch": new_pitch, "yaw": new_yaw, "roll": new_roll}
-                
-            except Exception as e:
-                logger.error(f"Error setting actor rotation: {e}")
-                results["rotation_error"] = str(e)
-        
-        # Set scale if any scale factor is provided
-        if any(param is not None for param in [scale_x, scale_y, scale_z]):
-            # Get current scale first for factors that weren't specified
-            get_scale_payload = {
-                "objectPath": actor_path,
-                "functionName": "GetActorScale3D"
-            }
-            
-            try:
-                response = requests.put(UE_URL, json=get_scale_payload, timeout=5)
-                response.raise_for_status()
-                current_scale = response.json().get("ReturnValue", {"X": 1, "Y": 1, "Z": 1})
+                if prop == "name":
+                    if error is None:
+                        modified = True
+                        results["name"] = value
+                    else:
+                        logger.error(f"Error setting actor name: {error}")
+                        results["name_error"] = error
+                    continue
                 
-                # Use current values for any scale factor not specified
-                new_scale_x = scale_x if scale_x is not None else current_scale.get("X", 1)
-                new_scale_y = scale_y if scale_y is not None else current_scale.get("Y", 1)
-                new_scale_z = scale_z if scale_z is not None else current_scale.get("Z", 1)
+                # Transform writes are followed by the Get call that reads the result back
+                readback_response = next(responses)
                 
-                # Set the new scale
-                set_scale_payload = {
-                    "objectPath": actor_path,
-                    "functionName": "SetActorScale3D",
-                    "parameters": {
-                        "NewScale3D": {"X": new_scale_x, "Y": new_scale_y, "Z": new_scale_z}
-                    }
-                }
+                if error is None:
+                    modified = True
+                    readback_error = batch_error(readback_response)
+                    if readback_error is None:
+                        record_transform_result(results, actor_path, prop, transform_values(readback_response, prop))
+                    else:
+                        logger.error(f"Error reading back actor {prop}: {readback_error}")
+                        results[f"{prop}_error"] = f"Applied, but reading back the new value failed: {readback_error}"
+                elif response.get("ResponseCode") is not None:
+                    # The partial write was rejected, fall back to reading the current value
+                    logger.info(f"Partial {prop} write rejected, falling back to get and set: {error}")
+                    readback.append(prop)
+                else:
+                    logger.error(f"Error setting actor {prop}: {error}")
+                    results[f"{prop}_error"] = error
+        
+        if readback:
+            # Get current values first for components that weren't specified, all in one batch
+            get_responses = await call_batch(client, [
+                (UE_CALL_PATH, {"objectPath": actor_path, "functionName": ACTOR_TRANSFORM_PROPERTIES[prop][0]})
+                for prop in readback
+            ])
+            
+            set_calls = []
+            set_properties = []
+            for prop, get_response in zip(readback, get_responses):
+                _, setter, parameter, _, _, _ = ACTOR_TRANSFORM_PROPERTIES[prop]
                 
-                response = requests.put(UE_URL, json=set_scale_payload, timeout=5)
-                response.raise_for_status()
-                modified = True
+                error = batch_error(get_response)
+                if error:
+                    logger.error(f"Error setting actor {prop}: {error}")
+                    results[f"{prop}_error"] = error
+                    continue
                 
-                # If this is a snowman, also include the actual dimensions
-                if "Snowman_BP" in actor_path:
-                    results["scale"] = {
-                        "x": new_scale_x, 
-                        "y": new_scale_y, 
-                        "z": new_scale_z,
-                        "actual_dimensions_cm": {
-                            "width": SNOWMAN_WIDTH * new_scale_x,
-                            "length": SNOWMAN_LENGTH * new_scale_y
-                        }
-                    }
-                else:
-                    results["scale"] = {"x": new_scale_x, "y": new_scale_y, "z": new_scale_z}
+                # Use current values for any component not specified
+                new_values = {**transform_values(get_response, prop), **requested[prop]}
                 
-            except Exception as e:
-                logger.error(f"Error setting actor scale: {e}")
-                results["scale_error"] = str(e)
-        
-        # Set name if provided
-        if name is not None:
-            try:
-                set_name_payload = {
+                set_calls.append((UE_CALL_PATH, {
                     "objectPath": actor_path,
-                     "functionName": "SetActorLabel",
+                    "functionName": setter,
                     "parameters": {
-                        "NewActorLabel": name
+                        parameter: new_values
                     }
-                }
-                
-                response = requests.put(UE_URL, json=set_name_payload, timeout=5)
-                response.raise_for_status()
-                modified = True
-                results["name"] = name
-                
-            except Exception as e:
-                logger.error(f"Error setting actor name: {e}")
-                results["name_error"] = str(e)
+                }))
+                set_properties.append((prop, new_values))
+            
+            if set_calls:
+                for (prop, new_values), set_response in zip(set_properties, await call_batch(client, set_calls)):
+                    error = batch_error(set_response)
+                    if error:
+                        logger.error(f"Error setting actor {prop}: {error}")
+                        results[f"{prop}_error"] = error
+                        continue
+                    
+                    modified = True
+                    record_transform_result(results, actor_path, prop, new_values)
+                    
+                    # The actor accepts full writes, so the earlier rejection was the partial write itself
+                    if partial_transform_writes_supported:
+                        logger.warning("Remote Control API rejected partial transform writes, using get and set from now on")
+                        partial_transform_writes_supported = False
         
         if modified:
-            return json.dumps({
+            return format_result({
                 "success": True,
                 "actor_path": actor_path,
                 "modified": results
-            }, indent=2)
+            })
         else:
-            return json.dumps({
+            return format_result({
                 "success": False,
                 "actor_path": actor_path,
                 "error": "No modifications were specified",
                 "results": results
-            }, indent=2)
+            })
             
     except Exception as e:
         logger.error(f"Error in modify_actor: {str(e)}")
         logger.error(traceback.format_exc())
-        return json.dumps({
+        return format_result({
             "success": False,
             "error": str(e)
-        }, indent=2)
+        })
 
 # If this module is run directly, start the server
 if __name__ == "__main__":
+    # Use the libuv-based event loop when uvloop is installed
+    try:
+        import uvloop
+        uvloop.install()
+        logger.info("Using uvloop event loop")
+    except ImportError:
+        pass
+    
     try:
         logger.info("Starting Unreal Engine MCP server...")
         mcp.run()